@@ -88,41 +88,48 @@ def _convert_extractors(extractors: Union[List, Dict]) -> Dict:
         {"varA": "body.varA", "varB": "body.varB"}
 
     """
-    v3_extractors: Dict = {}
-
+    # build new extractors, raw extractors may be shared by other testcases
     if isinstance(extractors, List):
         # [{"varA": "content.varA"}, {"varB": "json.varB"}]
+        # convert jmespath while merging, instead of another pass over merged dict
+        v3_extractors: Dict = {}
         for extractor in extractors:
             if not isinstance(extractor, Dict):
                 logger.error(f"Invalid extractor: {extractors}")
                 sys.exit(1)
             for k, v in extractor.items():
-                v3_extractors[k] = v
+                v3_extractors[k] = _convert_jmespath(v)
+
+        return v3_extractors
+
     elif isinstance(extractors, Dict):
         # {"varA": "body.varA", "varB": "body.varB"}
-        v3_extractors = extractors
+        return {k: _convert_jmespath(v) for k, v in extractors.items()}
+
     else:
         logger.error(f"Invalid extractor: {extractors}")
         sys.exit(1)
 
-    for k, v in v3_extractors.items():
-        v3_extractors[k] = _convert_jmespath(v)
-
-    return v3_extractors
-
 
 def _convert_validators(validators: List) -> List:
+    """ convert validators to v3 format, raw validators are left unchanged.
+    """
+    v3_validators = []
     for v in validators:
         if "check" in v and "expect" in v:
             # format1: {"check": "content.abc", "assert": "eq", "expect": 201}
-            v["check"] = _convert_jmespath(v["check"])
+            v = {**v, "check": _convert_jmespath(v["check"])}
 
         elif len(v) == 1:
             # format2: {'eq': ['status_code', 201]}
             comparator = list(v.keys())[0]
-            v[comparator][0] = _convert_jmespath(v[comparator][0])
+            compare_values = list(v[comparator])
+            compare_values[0] = _convert_jmespath(compare_values[0])
+            v = {comparator: compare_values}
+
+        v3_validators.append(v)
 
-    return validators
+    return v3_validators
 
 
 def _sort_request_by_custom_order(request: Dict) -> Dict:
@@ -161,10 +168,10 @@ def _sort_step_by_custom_order(step: Dict) -> Dict:
     return sort_dict_by_custom_order(step, custom_order)
 
 
-def _ensure_step_attachment(step: Dict) -> Dict:
-    test_dict = {
-        "name": step["name"],
-    }
+def _ensure_step_attachment(step: Dict, test_dict: Dict) -> Dict:
+    """ fill step attachments into test_dict in place
+    """
+    test_dict["name"] = step["name"]
 
     if "variables" in step:
         test_dict["variables"] = step["variables"]
@@ -200,7 +207,7 @@ def ensure_testcase_v3_api(api_content: Dict) -> Dict:
     teststep = {
         "request": _sort_request_by_custom_order(api_content["request"]),
     }
-    teststep.update(_ensure_step_attachment(api_content))
+    _ensure_step_attachment(api_content, teststep)
 
     teststep = _sort_step_by_custom_order(teststep)
 
@@ -234,15 +241,15 @@ def ensure_testcase_v3(test_content: Dict) -> Dict:
         teststep = {}
 
         if "request" in step:
-            teststep["request"] = _sort_request_by_custom_order(step.pop("request"))
+            teststep["request"] = _sort_request_by_custom_order(step["request"])
         elif "api" in step:
-            teststep["testcase"] = step.pop("api")
+            teststep["testcase"] = step["api"]
         elif "testcase" in step:
-            teststep["testcase"] = step.pop("testcase")
+            teststep["testcase"] = step["testcase"]
         else:
             raise exceptions.TestCaseFormatError(f"Invalid teststep: {step}")
 
-        teststep.update(_ensure_step_attachment(step))
+        _ensure_step_attachment(step, teststep)
 
         teststep = _sort_step_by_custom_order(teststep)
         v3_content["teststeps"].append(teststep)
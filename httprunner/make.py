@@ -390,9 +390,10 @@ def make_testcase(testcase: Dict, dir_path: Text = None) -> Text:
         # override testcase export
         ref_testcase_export: List = test_content["config"].get("export", [])
         if ref_testcase_export:
-            step_export: List = teststep.setdefault("export", [])
-            step_export.extend(ref_testcase_export)
-            teststep["export"] = list(set(step_export))
+            # order-preserving dedupe, without concatenating export lists
+            step_export: Dict = dict.fromkeys(teststep.get("export", []))
+            step_export.update(dict.fromkeys(ref_testcase_export))
+            teststep["export"] = list(step_export)
 
         # prepare ref testcase class name
         ref_testcase_cls_name = pytest_files_made_cache_mapping[
@@ -463,23 +464,38 @@ def make_testsuite(testsuite: Dict) -> NoReturn:
     # demo_testsuite.yml => demo_testsuite_yml
     testsuite_dir = f"{testsuite_dir}_{file_suffix.lstrip('.')}"
 
+    # testsuite config overrides are the same for all testcases
+    testsuite_base_url = testsuite_config.get("base_url")
+    testsuite_verify = testsuite_config.get("verify")
+
+    # the same testcase file may be referenced many times, load it only once
+    loaded_testcases_mapping: Dict[Text, Dict] = {}
+
     for testcase in testsuite["testcases"]:
         # get referenced testcase content
         testcase_file = testcase["testcase"]
         testcase_path = __ensure_absolute(testcase_file)
-        testcase_dict = load_test_file(testcase_path)
-        testcase_dict.setdefault("config", {})
+        if testcase_path not in loaded_testcases_mapping:
+            loaded_testcases_mapping[testcase_path] = load_test_file(testcase_path)
+
+        # only config is overridden for each testsuite testcase, copy config alone
+        # teststeps are shared, they are left unchanged when making testcase
+        loaded_testcase = loaded_testcases_mapping[testcase_path]
+        testcase_dict = {
+            **loaded_testcase,
+            "config": {**loaded_testcase.get("config", {})},
+        }
         testcase_dict["config"]["path"] = testcase_path
 
         # override testcase name
         testcase_dict["config"]["name"] = testcase["name"]
         # override base_url
-        base_url = testsuite_config.get("base_url") or testcase.get("base_url")
+        base_url = testsuite_base_url or testcase.get("base_url")
         if base_url:
             testcase_dict["config"]["base_url"] = base_url
         # override verify
-        if "verify" in testsuite_config:
-            testcase_dict["config"]["verify"] = testsuite_config["verify"]
+        if testsuite_verify is not None:
+            testcase_dict["config"]["verify"] = testsuite_verify
         # override variables
         # testsuite testcase variables > testsuite config variables
         testcase_variables = convert_variables(
@@ -487,10 +503,13 @@ def make_testsuite(testsuite: Dict) -> NoReturn:
         )
         testcase_variables = merge_variables(testcase_variables, testsuite_variables)
         # testsuite testcase variables > testcase config variables
-        testcase_dict["config"]["variables"] = convert_variables(
+        config_variables = convert_variables(
             testcase_dict["config"].get("variables", {}), testcase_path
         )
-        testcase_dict["config"]["variables"].update(testcase_variables)
+        testcase_dict["config"]["variables"] = {
+            **config_variables,
+            **testcase_variables,
+        }
 
         # override weight
         if "weight" in testcase:
@@ -510,12 +529,10 @@ def __make(tests_path: Text) -> NoReturn:
 
     """
     logger.info(f"make path: {tests_path}")
-    test_files = []
     if os.path.isdir(tests_path):
-        files_list = load_folder_files(tests_path)
-        test_files.extend(files_list)
+        test_files = load_folder_files(tests_path)
     elif os.path.isfile(tests_path):
-        test_files.append(tests_path)
+        test_files = [tests_path]
     else:
         raise exceptions.TestcaseNotFound(f"Invalid tests path: {tests_path}")
 
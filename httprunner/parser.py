@@ -1,8 +1,10 @@
 import ast
 import builtins
+import collections
+import functools
 import re
 import os
-from typing import Any, Set, Text, Callable, List, Dict, Union
+from typing import Any, Set, FrozenSet, Text, Callable, List, Dict, Union, Tuple
 
 from loguru import logger
 from sentry_sdk import capture_exception
@@ -10,14 +12,33 @@ from sentry_sdk import capture_exception
 from httprunner import loader, utils, exceptions
 from httprunner.models import VariablesMapping, FunctionsMapping
 
+try:
+    # third-party regex engine is faster at scanning notations if installed
+    import regex as notation_re
+except ImportError:
+    notation_re = re
+
 absolute_http_url_regexp = re.compile(r"^https?://", re.I)
 
 # use $$ to escape $ notation
-dolloar_regex_compile = re.compile(r"\$\$")
+dolloar_regex_compile = notation_re.compile(r"\$\$")
 # variable notation, e.g. ${var} or $var
-variable_regex_compile = re.compile(r"\$\{(\w+)\}|\$(\w+)")
+variable_regex_compile = notation_re.compile(r"\$\{(\w+)\}|\$(\w+)")
+# $$ or variable notation, $$ is matched first thus escaped $ is skipped
+dollar_variable_regex_compile = notation_re.compile(r"(\$\$)|\$\{(\w+)\}|\$(\w+)")
 # function notation, e.g. ${func1($var_1, $var_3)}
-function_regex_compile = re.compile(r"\$\{(\w+)\(([\$\w\.\-/\s=,]*)\)\}")
+function_regex_compile = notation_re.compile(r"\$\{(\w+)\(([\$\w\.\-/\s=,]*)\)\}")
+# plain decimal numbers, evaluated by ast.literal_eval to int/float
+# notice: number with leading zeros, e.g. 0123, is not a valid int literal
+int_regex_compile = re.compile(r"[-+]?(0|[1-9][0-9]*)")
+float_regex_compile = re.compile(r"[-+]?([0-9]+\.[0-9]*|\.[0-9]+)")
+# all notations combined, in priority order: $$ > ${func($a, $b)} > $var
+notation_regex_compile = notation_re.compile(
+    r"(\$\$)|\$\{(\w+)\(([\$\w\.\-/\s=,]*)\)\}|\$\{(\w+)\}|\$(\w+)"
+)
+
+# HttpRunner builtin functions, e.g. comparators, loaded on first use
+builtin_functions_mapping: Union[FunctionsMapping, None] = None
 
 
 def parse_string_value(str_value: Text) -> Any:
@@ -27,6 +48,26 @@ def parse_string_value(str_value: Text) -> Any:
          "abc" => "abc"
          "$var" => "$var"
     """
+    if not isinstance(str_value, str):
+        return str_value
+
+    # fast path for plain numbers and names, avoid building AST for them
+    try:
+        if int_regex_compile.fullmatch(str_value):
+            return int(str_value)
+        elif float_regex_compile.fullmatch(str_value):
+            return float(str_value)
+    except ValueError:
+        # e.g. integer string exceeds the digits limit, leave it to literal_eval
+        pass
+
+    if str_value.startswith("$"):
+        # e.g. $var, ${func}
+        return str_value
+    elif str_value.isidentifier() and str_value not in ["True", "False", "None"]:
+        # e.g. abc
+        return str_value
+
     try:
         return ast.literal_eval(str_value)
     except ValueError:
@@ -69,40 +110,18 @@ def regex_findall_variables(raw_string: Text) -> List[Text]:
         []
 
     """
-    try:
-        match_start_position = raw_string.index("$", 0)
-    except ValueError:
+    if "$" not in raw_string:
         return []
 
-    vars_list = []
-    while match_start_position < len(raw_string):
-
-        # Notice: notation priority
-        # $$ > $var
-
-        # search $$
-        dollar_match = dolloar_regex_compile.match(raw_string, match_start_position)
-        if dollar_match:
-            match_start_position = dollar_match.end()
-            continue
-
-        # search variable like ${var} or $var
-        var_match = variable_regex_compile.match(raw_string, match_start_position)
-        if var_match:
-            var_name = var_match.group(1) or var_match.group(2)
-            vars_list.append(var_name)
-            match_start_position = var_match.end()
-            continue
-
-        curr_position = match_start_position
-        try:
-            # find next $ location
-            match_start_position = raw_string.index("$", curr_position + 1)
-        except ValueError:
-            # break while loop
-            break
-
-    return vars_list
+    # Notice: notation priority
+    # $$ > $var
+    return [
+        var_name_1 or var_name_2
+        for dollar, var_name_1, var_name_2 in dollar_variable_regex_compile.findall(
+            raw_string
+        )
+        if not dollar
+    ]
 
 
 def regex_findall_functions(content: Text) -> List[Text]:
@@ -132,6 +151,10 @@ def regex_findall_functions(content: Text) -> List[Text]:
 
     """
     try:
+        if "${" not in content:
+            # no function notation, skip regex searching
+            return []
+
         return function_regex_compile.findall(content)
     except TypeError as ex:
         capture_exception(ex)
@@ -141,22 +164,32 @@ def regex_findall_functions(content: Text) -> List[Text]:
 def extract_variables(content: Any) -> Set:
     """ extract all variables in content recursively.
     """
+    variables = set()
+    _collect_variables(content, variables)
+    return variables
+
+
+def _collect_variables(
+    content: Any, variables: Set, include_keys: bool = False
+) -> None:
+    """ collect variables in content into one shared set, instead of allocating and
+        merging a new set for each nested item.
+        if include_keys is True, variables in dict keys are collected as well,
+        e.g. {"$key": "value"}, since dict keys are also parsed by parse_data.
+    """
     if isinstance(content, (list, set, tuple)):
-        variables = set()
         for item in content:
-            variables = variables | extract_variables(item)
-        return variables
+            _collect_variables(item, variables, include_keys)
 
     elif isinstance(content, dict):
-        variables = set()
         for key, value in content.items():
-            variables = variables | extract_variables(value)
-        return variables
-
-    elif isinstance(content, str):
-        return set(regex_findall_variables(content))
+            if include_keys:
+                _collect_variables(key, variables, include_keys)
+            _collect_variables(value, variables, include_keys)
 
-    return set()
+    elif isinstance(content, str) and "$" in content:
+        # plain text without $ is neither scanned nor kept in compile cache
+        variables.update(_compile_string(content).variables)
 
 
 def parse_function_params(params: Text) -> Dict:
@@ -197,6 +230,11 @@ def parse_function_params(params: Text) -> Dict:
         return function_meta
 
     args_list = params_str.split(",")
+    if "=" not in params_str:
+        # only positional args, e.g. ${sum_two(1, 2)}
+        function_meta["args"] = [parse_string_value(arg.strip()) for arg in args_list]
+        return function_meta
+
     for arg in args_list:
         arg = arg.strip()
         if "=" in arg:
@@ -265,10 +303,14 @@ def get_mapping_function(
 
         return getattr(uploader, function_name)
 
+    global builtin_functions_mapping
+    if builtin_functions_mapping is None:
+        # load HttpRunner builtin functions only once
+        builtin_functions_mapping = loader.load_builtin_functions()
+
     try:
         # check if HttpRunner builtin functions
-        built_in_functions = loader.load_builtin_functions()
-        return built_in_functions[function_name]
+        return builtin_functions_mapping[function_name]
     except KeyError:
         pass
 
@@ -281,6 +323,91 @@ def get_mapping_function(
     raise exceptions.FunctionNotFound(f"{function_name} is not found.")
 
 
+class _CompiledString(object):
+    """ raw string content scanned into literal and notation segments.
+
+    Scanning result only depends on the raw string, thus it can be shared by all
+    parse_string calls with identical content, e.g. "$base_url" or "${get_timestamp()}"
+    which are usually repeated across many teststeps.
+
+    Each segment is one of the following:
+        str: literal content, "$$" has already been unescaped to "$"
+        ("var", var_name): variable notation, $var or ${var}
+        ("func", func_name, func_params_str): function notation, ${func($a, $b)}
+
+    Variables referenced in raw string, including those in function params, are
+    collected while scanning, thus extract_variables needs no extra regex search.
+
+    """
+
+    __slots__ = ("raw_string", "segments", "variables", "is_single_notation")
+
+    def __init__(self, raw_string: Text):
+        self.raw_string = raw_string
+        self.segments: List[Union[Text, tuple]] = []
+        variables = set()
+
+        last_end = 0
+        for match in notation_regex_compile.finditer(raw_string):
+            self.__append_literal(raw_string[last_end : match.start()])
+            last_end = match.end()
+
+            dollar, func_name, func_params_str, var_name_1, var_name_2 = match.groups()
+            if dollar:
+                # $$
+                self.__append_literal("$")
+            elif func_name:
+                # ${func($a, $b)}
+                self.segments.append(("func", func_name, func_params_str))
+                variables.update(regex_findall_variables(func_params_str))
+            else:
+                # ${var} or $var
+                var_name = var_name_1 or var_name_2
+                self.segments.append(("var", var_name))
+                variables.add(var_name)
+
+        self.__append_literal(raw_string[last_end:])
+        self.variables: FrozenSet[Text] = frozenset(variables)
+        # raw string is exactly one notation, e.g. "$var" or "${func($a)}",
+        # its value is returned directly instead of being converted to string
+        self.is_single_notation: bool = len(self.segments) == 1 and not isinstance(
+            self.segments[0], str
+        )
+
+    def __append_literal(self, literal: Text):
+        if not literal:
+            return
+
+        if self.segments and isinstance(self.segments[-1], str):
+            self.segments[-1] += literal
+        else:
+            self.segments.append(literal)
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_string(raw_string: Text) -> _CompiledString:
+    """ compiled strings are shared by all testcases and parameter rows.
+        they are keyed on raw string alone, because neither variables nor functions
+        are bound until parse_string is called.
+    """
+    return _CompiledString(raw_string)
+
+
+@functools.lru_cache(maxsize=2048)
+def _get_function_meta(func_params_str: Text) -> Tuple[List, Dict]:
+    """ parse function params only once, even if they are used in different strings,
+        e.g. "${gen_random_string(15)}" and "user_${gen_random_string(15)}".
+        function is still called on every evaluation because its return value may vary.
+        Notice: function meta is shared, it should not be modified.
+
+    Returns:
+        tuple: (args, kwargs)
+
+    """
+    function_meta = parse_function_params(func_params_str)
+    return function_meta["args"], function_meta["kwargs"]
+
+
 def parse_string(
     raw_string: Text,
     variables_mapping: VariablesMapping,
@@ -304,88 +431,102 @@ def parse_string(
             "abc4def"
 
     """
-    try:
-        match_start_position = raw_string.index("$", 0)
-        parsed_string = raw_string[0:match_start_position]
-    except ValueError:
-        parsed_string = raw_string
-        return parsed_string
-
-    while match_start_position < len(raw_string):
-
-        # Notice: notation priority
-        # $$ > ${func($a, $b)} > $var
+    compiled_string = _compile_string(raw_string)
+    if compiled_string.is_single_notation:
+        # raw_string is a variable or function, e.g. "$var" or "${add_one(3)}",
+        # return its value directly
+        return _eval_segment(
+            compiled_string.segments[0], variables_mapping, functions_mapping
+        )
 
-        # search $$
-        dollar_match = dolloar_regex_compile.match(raw_string, match_start_position)
-        if dollar_match:
-            match_start_position = dollar_match.end()
-            parsed_string += "$"
-            continue
+    # raw_string contains literal content or many notations, e.g. "abc${var}def"
+    parsed_parts: List[Text] = []
+    for segment in compiled_string.segments:
+        if isinstance(segment, str):
+            parsed_parts.append(segment)
+        else:
+            parsed_parts.append(
+                str(_eval_segment(segment, variables_mapping, functions_mapping))
+            )
 
-        # search function like ${func($a, $b)}
-        func_match = function_regex_compile.match(raw_string, match_start_position)
-        if func_match:
-            func_name = func_match.group(1)
-            func = get_mapping_function(func_name, functions_mapping)
-
-            func_params_str = func_match.group(2)
-            function_meta = parse_function_params(func_params_str)
-            args = function_meta["args"]
-            kwargs = function_meta["kwargs"]
-            parsed_args = parse_data(args, variables_mapping, functions_mapping)
-            parsed_kwargs = parse_data(kwargs, variables_mapping, functions_mapping)
-
-            try:
-                func_eval_value = func(*parsed_args, **parsed_kwargs)
-            except Exception as ex:
-                logger.error(
-                    f"call function error:\n"
-                    f"func_name: {func_name}\n"
-                    f"args: {parsed_args}\n"
-                    f"kwargs: {parsed_kwargs}\n"
-                    f"{type(ex).__name__}: {ex}"
-                )
-                raise
+    return "".join(parsed_parts)
 
-            func_raw_str = "${" + func_name + f"({func_params_str})" + "}"
-            if func_raw_str == raw_string:
-                # raw_string is a function, e.g. "${add_one(3)}", return its eval value directly
-                return func_eval_value
 
-            # raw_string contains one or many functions, e.g. "abc${add_one(3)}def"
-            parsed_string += str(func_eval_value)
-            match_start_position = func_match.end()
-            continue
+def _eval_segment(
+    segment: tuple,
+    variables_mapping: VariablesMapping,
+    functions_mapping: FunctionsMapping,
+) -> Any:
+    """ get value of a variable notation, or call function of a function notation.
+    """
+    if segment[0] == "var":
+        return get_mapping_variable(segment[1], variables_mapping)
 
-        # search variable like ${var} or $var
-        var_match = variable_regex_compile.match(raw_string, match_start_position)
-        if var_match:
-            var_name = var_match.group(1) or var_match.group(2)
-            var_value = get_mapping_variable(var_name, variables_mapping)
+    _, func_name, func_params_str = segment
+    func = get_mapping_function(func_name, functions_mapping)
 
-            if f"${var_name}" == raw_string or "${" + var_name + "}" == raw_string:
-                # raw_string is a variable, $var or ${var}, return its value directly
-                return var_value
+    args, kwargs = _get_function_meta(func_params_str)
+    parsed_args = parse_data(args, variables_mapping, functions_mapping)
+    parsed_kwargs = parse_data(kwargs, variables_mapping, functions_mapping)
 
-            # raw_string contains one or many variables, e.g. "abc${var}def"
-            parsed_string += str(var_value)
-            match_start_position = var_match.end()
-            continue
+    try:
+        return func(*parsed_args, **parsed_kwargs)
+    except Exception as ex:
+        logger.error(
+            f"call function error:\n"
+            f"func_name: {func_name}\n"
+            f"args: {parsed_args}\n"
+            f"kwargs: {parsed_kwargs}\n"
+            f"{type(ex).__name__}: {ex}"
+        )
+        raise
 
-        curr_position = match_start_position
-        try:
-            # find next $ location
-            match_start_position = raw_string.index("$", curr_position + 1)
-            remain_string = raw_string[curr_position:match_start_position]
-        except ValueError:
-            remain_string = raw_string[curr_position:]
-            # break while loop
-            match_start_position = len(raw_string)
 
-        parsed_string += remain_string
+def _parse_text(
+    raw_string: Text,
+    variables_mapping: VariablesMapping,
+    functions_mapping: FunctionsMapping,
+) -> Any:
+    # only strip whitespaces and tabs, \n\r is left because they maybe used in changeset
+    # strings loaded from YAML/JSON are usually stripped already, avoid a new copy
+    if raw_string[:1] in (" ", "\t") or raw_string[-1:] in (" ", "\t"):
+        raw_string = raw_string.strip(" \t")
+    if "$" not in raw_string:
+        # most strings are plain text without any variable or function
+        return raw_string
+
+    # content in string format may contains variables and functions
+    return parse_string(raw_string, variables_mapping, functions_mapping)
+
+
+# node kinds when walking raw data
+_LEAF, _TEXT, _SEQUENCE, _MAPPING = range(4)
+# node kind dispatched by type identity, which is cheaper than isinstance checks
+_node_kinds: Dict[type, int] = {
+    type(None): _LEAF,
+    bool: _LEAF,
+    int: _LEAF,
+    float: _LEAF,
+    str: _TEXT,
+    list: _SEQUENCE,
+    set: _SEQUENCE,
+    tuple: _SEQUENCE,
+    dict: _MAPPING,
+}
+
+
+def _get_subclass_node_kind(value: Any) -> int:
+    """ get node kind for types not in _node_kinds, e.g. OrderedDict
+    """
+    if isinstance(value, str):
+        return _TEXT
+    elif isinstance(value, (list, set, tuple)):
+        return _SEQUENCE
+    elif isinstance(value, dict):
+        return _MAPPING
 
-    return parsed_string
+    # other types, e.g. bytes, object
+    return _LEAF
 
 
 def parse_data(
@@ -395,73 +536,161 @@ def parse_data(
 ) -> Any:
     """ parse raw data with evaluated variables mapping.
         Notice: variables_mapping should not contain any variable or function.
+
+        Nested list/dict content is walked with an explicit stack instead of recursion.
     """
-    if isinstance(raw_data, str):
-        # content in string format may contains variables and functions
-        variables_mapping = variables_mapping or {}
-        functions_mapping = functions_mapping or {}
-        # only strip whitespaces and tabs, \n\r is left because they maybe used in changeset
-        raw_data = raw_data.strip(" \t")
-        return parse_string(raw_data, variables_mapping, functions_mapping)
-
-    elif isinstance(raw_data, (list, set, tuple)):
-        return [
-            parse_data(item, variables_mapping, functions_mapping) for item in raw_data
-        ]
+    node_kind = _node_kinds.get(type(raw_data))
+    if node_kind is None:
+        node_kind = _get_subclass_node_kind(raw_data)
 
-    elif isinstance(raw_data, dict):
-        parsed_data = {}
-        for key, value in raw_data.items():
-            parsed_key = parse_data(key, variables_mapping, functions_mapping)
-            parsed_value = parse_data(value, variables_mapping, functions_mapping)
-            parsed_data[parsed_key] = parsed_value
+    if node_kind == _LEAF:
+        return raw_data
 
-        return parsed_data
+    variables_mapping = variables_mapping or {}
+    functions_mapping = functions_mapping or {}
+
+    if node_kind == _TEXT:
+        return _parse_text(raw_data, variables_mapping, functions_mapping)
+
+    # wrap raw data as the only item of a list, thus it is handled as other nodes
+    parsed_root = []
+    # each item is (iterator of raw container items, parsed container to be filled),
+    # the top container is walked first, its parent is continued after it is done
+    stack = [(enumerate([raw_data]), parsed_root)]
+    while stack:
+        raw_items, parsed_node = stack[-1]
+        is_dict = type(parsed_node) is dict
+
+        for key, value in raw_items:
+            if is_dict:
+                # parse key before value, functions are called in document order
+                if type(key) is str:
+                    key = _parse_text(key, variables_mapping, functions_mapping)
+                else:
+                    key = parse_data(key, variables_mapping, functions_mapping)
+
+            node_kind = _node_kinds.get(type(value))
+            if node_kind is None:
+                node_kind = _get_subclass_node_kind(value)
+
+            if node_kind == _LEAF:
+                parsed_value = value
+            elif node_kind == _TEXT:
+                parsed_value = _parse_text(value, variables_mapping, functions_mapping)
+            elif node_kind == _SEQUENCE:
+                parsed_value = []
+                child_items = enumerate(value)
+            else:
+                parsed_value = {}
+                child_items = iter(value.items())
+
+            if is_dict:
+                parsed_node[key] = parsed_value
+            else:
+                parsed_node.append(parsed_value)
+
+            if node_kind == _SEQUENCE or node_kind == _MAPPING:
+                # walk nested container first, remaining items are walked afterwards
+                stack.append((child_items, parsed_value))
+                break
+        else:
+            # all items of current container have been parsed
+            stack.pop()
 
-    else:
-        # other types, e.g. None, int, float, bool
-        return raw_data
+    return parsed_root[0]
 
 
 def parse_variables_mapping(
-    variables_mapping: VariablesMapping, functions_mapping: FunctionsMapping = None
+    variables_mapping: VariablesMapping,
+    functions_mapping: FunctionsMapping = None,
+    parsed_variables_mapping: VariablesMapping = None,
 ) -> VariablesMapping:
+    """ parse variables mapping, each variable is evaluated only once after all
+        variables it references have been evaluated (topological order).
 
-    parsed_variables: VariablesMapping = {}
+    Args:
+        variables_mapping: variables to be parsed.
+        functions_mapping: functions mapping.
+        parsed_variables_mapping: variables that have been parsed before, e.g. testcase
+            config variables, they can be referenced but will not be parsed again.
+            variables_mapping has higher priority for the same variable name.
+
+    Returns:
+        parsed variables, including parsed_variables_mapping.
 
-    while len(parsed_variables) != len(variables_mapping):
-        for var_name in variables_mapping:
+    """
+    parsed_variables_mapping = parsed_variables_mapping or {}
+
+    # variables in variables_mapping referenced by each variable
+    dependencies: Dict[Text, Set] = {}
+    for var_name, var_value in variables_mapping.items():
+        if _node_kinds.get(type(var_value)) == _LEAF:
+            # e.g. int/float/bool/None, which references no variable
+            dependencies[var_name] = set()
+            continue
 
-            if var_name in parsed_variables:
-                continue
+        # dict keys may reference variables too, e.g. {"headers": {"$key": "v"}}
+        variables = set()
+        _collect_variables(var_value, variables, include_keys=True)
+
+        # check if reference variable itself
+        if var_name in variables:
+            # e.g.
+            # variables_mapping = {"token": "abc$token"}
+            # variables_mapping = {"key": ["$key", 2]}
+            raise exceptions.VariableNotFound(var_name)
+
+        # check if reference variable not defined
+        not_defined_variables = [
+            v_name
+            for v_name in variables
+            if v_name not in variables_mapping
+            and v_name not in parsed_variables_mapping
+        ]
+        if not_defined_variables:
+            # e.g. {"varA": "123$varB", "varB": "456$varC"}
+            # e.g. {"varC": "${sum_two($a, $b)}"}
+            raise exceptions.VariableNotFound(not_defined_variables)
 
-            var_value = variables_mapping[var_name]
-            variables = extract_variables(var_value)
+        dependencies[var_name] = {
+            v_name for v_name in variables if v_name in variables_mapping
+        }
 
-            # check if reference variable itself
-            if var_name in variables:
-                # e.g.
-                # variables_mapping = {"token": "abc$token"}
-                # variables_mapping = {"key": ["$key", 2]}
-                raise exceptions.VariableNotFound(var_name)
+    # variables referencing each variable
+    dependents: Dict[Text, List[Text]] = {var_name: [] for var_name in dependencies}
+    in_degree: Dict[Text, int] = {}
+    for var_name, variables in dependencies.items():
+        in_degree[var_name] = len(variables)
+        for v_name in variables:
+            dependents[v_name].append(var_name)
+
+    ready = collections.deque(
+        var_name for var_name, degree in in_degree.items() if degree == 0
+    )
+    parsed_variables: VariablesMapping = {**parsed_variables_mapping}
+    parsed_names: Set[Text] = set()
+    while ready:
+        var_name = ready.popleft()
+        parsed_variables[var_name] = parse_data(
+            variables_mapping[var_name], parsed_variables, functions_mapping
+        )
+        parsed_names.add(var_name)
 
-            # check if reference variable not in variables_mapping
-            not_defined_variables = [
-                v_name for v_name in variables if v_name not in variables_mapping
-            ]
-            if not_defined_variables:
-                # e.g. {"varA": "123$varB", "varB": "456$varC"}
-                # e.g. {"varC": "${sum_two($a, $b)}"}
-                raise exceptions.VariableNotFound(not_defined_variables)
+        for dependent in dependents[var_name]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                ready.append(dependent)
 
-            try:
-                parsed_value = parse_data(
-                    var_value, parsed_variables, functions_mapping
-                )
-            except exceptions.VariableNotFound:
-                continue
+    if len(parsed_names) != len(variables_mapping):
+        # circular reference, e.g. {"varA": "$varB", "varB": "$varA"}
+        circular_variables = [
+            v_name for v_name in variables_mapping if v_name not in parsed_names
+        ]
+        raise exceptions.VariableNotFound(circular_variables)
 
-            parsed_variables[var_name] = parsed_value
+    if not parsed_variables_mapping:
+        # keep the same order as variables_mapping
+        return {var_name: parsed_variables[var_name] for var_name in variables_mapping}
 
     return parsed_variables
 
@@ -59,11 +59,15 @@ class HttpRunner(object):
         self.__config = self.config.perform()
         self.__teststeps = []
         for step in self.teststeps:
-            self.__teststeps.append(step.perform())
+            # teststeps are class attributes shared by all parameter rows, and step
+            # variables are overridden when running, thus each run needs its own step.
+            # shallow copy is enough, raw variables are replaced instead of modified
+            self.__teststeps.append(step.perform().copy())
 
     @property
     def raw_testcase(self) -> TestCase:
-        if not hasattr(self, "__config"):
+        # build tests lazily only once, private attribute name is mangled
+        if not hasattr(self, "_HttpRunner__config"):
             self.__init_tests__()
 
         return TestCase(config=self.__config, teststeps=self.__teststeps)
@@ -115,16 +119,17 @@ class HttpRunner(object):
             logger.error(f"Invalid hooks format: {hooks}")
             return
 
+        functions_mapping = self.__project_meta.functions
         for hook in hooks:
             if isinstance(hook, Text):
                 # format 1: ["${func()}"]
                 logger.debug(f"call hook function: {hook}")
-                parse_data(hook, step_variables, self.__project_meta.functions)
+                parse_data(hook, step_variables, functions_mapping)
             elif isinstance(hook, Dict) and len(hook) == 1:
                 # format 2: {"var": "${func()}"}
                 var_name, hook_content = list(hook.items())[0]
                 hook_content_eval = parse_data(
-                    hook_content, step_variables, self.__project_meta.functions
+                    hook_content, step_variables, functions_mapping
                 )
                 logger.debug(
                     f"call hook function: {hook_content}, got value: {hook_content_eval}"
@@ -137,13 +142,14 @@ class HttpRunner(object):
     def __run_step_request(self, step: TStep) -> StepData:
         """run teststep: request"""
         step_data = StepData(name=step.name)
+        functions_mapping = self.__project_meta.functions
 
         # parse
-        prepare_upload_step(step, self.__project_meta.functions)
+        prepare_upload_step(step, functions_mapping)
         request_dict = step.request.dict()
         request_dict.pop("upload", None)
         parsed_request_dict = parse_data(
-            request_dict, step.variables, self.__project_meta.functions
+            request_dict, step.variables, functions_mapping
         )
         parsed_request_dict["headers"].setdefault(
             "HRUN-Request-ID",
@@ -205,9 +211,7 @@ class HttpRunner(object):
         validators = step.validators
         session_success = False
         try:
-            resp_obj.validate(
-                validators, variables_mapping, self.__project_meta.functions
-            )
+            resp_obj.validate(validators, variables_mapping, functions_mapping)
             session_success = True
         except ValidationFailure:
             session_success = False
@@ -305,15 +309,12 @@ class HttpRunner(object):
         return step_data.export_vars
 
     def __parse_config(self, config: TConfig) -> NoReturn:
+        functions_mapping = self.__project_meta.functions
         config.variables.update(self.__session_variables)
-        config.variables = parse_variables_mapping(
-            config.variables, self.__project_meta.functions
-        )
-        config.name = parse_data(
-            config.name, config.variables, self.__project_meta.functions
-        )
+        config.variables = parse_variables_mapping(config.variables, functions_mapping)
+        config.name = parse_data(config.name, config.variables, functions_mapping)
         config.base_url = parse_data(
-            config.base_url, config.variables, self.__project_meta.functions
+            config.base_url, config.variables, functions_mapping
         )
 
     def run_testcase(self, testcase: TestCase) -> "HttpRunner":
@@ -335,20 +336,25 @@ class HttpRunner(object):
         self.__start_at = time.time()
         self.__step_datas: List[StepData] = []
         self.__session = self.__session or HttpSession()
+        config_variables = self.__config.variables
+        functions_mapping = self.__project_meta.functions
         # save extracted variables of teststeps
         extracted_variables: VariablesMapping = {}
+        # extracted variables from previous steps > testcase config variables
+        # both of them have been parsed, thus they will not be parsed again
+        # only changes after a step extracts new variables
+        session_variables = {**config_variables, **extracted_variables}
 
         # run teststeps
         for step in self.__teststeps:
             # override variables
-            # step variables > extracted variables from previous steps
-            step.variables = merge_variables(step.variables, extracted_variables)
-            # step variables > testcase config variables
-            step.variables = merge_variables(step.variables, self.__config.variables)
+            # step variables > session variables
+            # step variables referencing the same name are dropped, e.g. {"a": "$a"}
+            step_variables = merge_variables(step.variables, {})
 
             # parse variables
             step.variables = parse_variables_mapping(
-                step.variables, self.__project_meta.functions
+                step_variables, functions_mapping, session_variables
             )
 
             # run step
@@ -359,7 +365,9 @@ class HttpRunner(object):
                 extract_mapping = self.__run_step(step)
 
             # save extracted variables to session variables
-            extracted_variables.update(extract_mapping)
+            if extract_mapping:
+                extracted_variables.update(extract_mapping)
+                session_variables = {**config_variables, **extracted_variables}
 
         self.__session_variables.update(extracted_variables)
         self.__duration = time.time() - self.__start_at
@@ -438,9 +446,11 @@ class HttpRunner(object):
         if param:
             config_variables.update(param)
         config_variables.update(self.__session_variables)
-        self.__config.name = parse_data(
-            self.__config.name, config_variables, self.__project_meta.functions
-        )
+        if "$" in self.__config.name:
+            # most testcase names are plain text without any variable or function
+            self.__config.name = parse_data(
+                self.__config.name, config_variables, self.__project_meta.functions
+            )
 
         if USE_ALLURE:
             # update allure report meta
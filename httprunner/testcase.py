@@ -60,7 +60,7 @@ class Config(object):
             base_url=self.__base_url,
             verify=self.__verify,
             variables=self.__variables,
-            export=list(set(self.__export)),
+            export=list(dict.fromkeys(self.__export)),
             path=self.__path,
             weight=self.__weight,
         )
@@ -1,12 +1,11 @@
 import collections
-import copy
 import json
 import os.path
 import platform
 import uuid
 from multiprocessing import Queue
 import itertools
-from typing import Dict, List, Any, Union, Text
+from typing import Dict, List, Any, Union, Text, Iterator
 
 import sentry_sdk
 from loguru import logger
@@ -200,16 +199,14 @@ def merge_variables(
     """
     step_new_variables = {}
     for key, value in variables.items():
-        if f"${key}" == value or "${" + key + "}" == value:
+        if isinstance(value, str) and value in (f"${key}", "${" + key + "}"):
             # e.g. {"base_url": "$base_url"}
             # or {"base_url": "${base_url}"}
             continue
 
         step_new_variables[key] = value
 
-    merged_variables = copy.copy(variables_to_be_overridden)
-    merged_variables.update(step_new_variables)
-    return merged_variables
+    return {**variables_to_be_overridden, **step_new_variables}
 
 
 def is_support_multiprocessing() -> bool:
@@ -221,6 +218,43 @@ def is_support_multiprocessing() -> bool:
         return False
 
 
+def iter_cartesian_product(*args: List[Dict]) -> Iterator[Dict]:
+    """ generate cartesian product for lists lazily, each product item is merged
+        into one dict only when it is iterated.
+
+    Args:
+        args (list of list): lists to be generated with cartesian product
+
+    Returns:
+        iterator: cartesian product items iterator
+
+    Examples:
+
+        >>> arg1 = [{"a": 1}, {"a": 2}]
+        >>> arg2 = [{"x": 111, "y": 112}, {"x": 121, "y": 122}]
+        >>> list(iter_cartesian_product(arg1, arg2))
+            [
+                {'a': 1, 'x': 111, 'y': 112},
+                {'a': 1, 'x': 121, 'y': 122},
+                {'a': 2, 'x': 111, 'y': 112},
+                {'a': 2, 'x': 121, 'y': 122}
+            ]
+
+    """
+    if not args:
+        return iter([])
+    elif len(args) == 1:
+        return iter(args[0])
+
+    # resolve items of each parameter dict once, instead of once per product item
+    args_items = [[tuple(item.items()) for item in arg] for arg in args]
+    chain_items = itertools.chain.from_iterable
+    return (
+        dict(chain_items(product_items_tuple))
+        for product_items_tuple in itertools.product(*args_items)
+    )
+
+
 def gen_cartesian_product(*args: List[Dict]) -> List[Dict]:
     """ generate cartesian product for lists
 
@@ -246,17 +280,4 @@ def gen_cartesian_product(*args: List[Dict]) -> List[Dict]:
             ]
 
     """
-    if not args:
-        return []
-    elif len(args) == 1:
-        return args[0]
-
-    product_list = []
-    for product_item_tuple in itertools.product(*args):
-        product_item_dict = {}
-        for item in product_item_tuple:
-            product_item_dict.update(item)
-
-        product_list.append(product_item_dict)
-
-    return product_list
+    return list(iter_cartesian_product(*args))
@@ -80,6 +80,24 @@ class TestCompat(unittest.TestCase):
             [{"eq": ["body[0].name", 201]}],
         )
 
+    def test_convert_keep_raw_content(self):
+        extractors = {"varA": "content.varA"}
+        compat._convert_extractors(extractors)
+        self.assertEqual(extractors, {"varA": "content.varA"})
+
+        validators = [
+            {"check": "content.abc", "assert": "eq", "expect": 201},
+            {"eq": ["content.abc", 201]},
+        ]
+        compat._convert_validators(validators)
+        self.assertEqual(
+            validators,
+            [
+                {"check": "content.abc", "assert": "eq", "expect": 201},
+                {"eq": ["content.abc", 201]},
+            ],
+        )
+
     def test_ensure_testcase_v3_api(self):
         api_content = {
             "name": "get with params",
@@ -2,7 +2,7 @@ import os
 import time
 import unittest
 
-from httprunner import parser
+from httprunner import loader, parser
 from httprunner.exceptions import VariableNotFound, FunctionNotFound
 from httprunner.loader import load_project_meta
 
@@ -20,12 +20,69 @@ class TestParserBasic(unittest.TestCase):
         with self.assertRaises(VariableNotFound):
             parser.parse_variables_mapping(variables)
 
+    def test_parse_variables_mapping_circular_reference(self):
+        variables = {"varA": "$varB", "varB": "abc$varA", "a": 1}
+        with self.assertRaises(VariableNotFound):
+            parser.parse_variables_mapping(variables)
+
+    def test_parse_variables_mapping_with_functions(self):
+        variables = {
+            "sum": "${add_two_nums($a, $b)}",
+            "a": "$c",
+            "b": 2,
+            "c": 1,
+            "msg": "sum=$sum",
+        }
+        functions = {"add_two_nums": lambda a, b: a + b}
+        parsed_variables = parser.parse_variables_mapping(variables, functions)
+        self.assertEqual(
+            parsed_variables, {"sum": 3, "a": 1, "b": 2, "c": 1, "msg": "sum=3"}
+        )
+        self.assertEqual(list(parsed_variables.keys()), list(variables.keys()))
+
+    def test_parse_variables_mapping_with_parsed_variables(self):
+        parsed_variables_mapping = {"a": 1, "b": "$b_not_parsed", "c": 3}
+        variables = {"varA": "$a", "varB": "$b", "c": "${add_one($a)}"}
+        functions = {"add_one": lambda x: x + 1}
+        parsed_variables = parser.parse_variables_mapping(
+            variables, functions, parsed_variables_mapping
+        )
+        self.assertEqual(
+            parsed_variables,
+            {"a": 1, "b": "$b_not_parsed", "c": 2, "varA": 1, "varB": "$b_not_parsed"},
+        )
+        self.assertEqual(parsed_variables_mapping["c"], 3)
+
+        with self.assertRaises(VariableNotFound):
+            parser.parse_variables_mapping({"varA": "$d"}, {}, parsed_variables_mapping)
+
+    def test_parse_variables_mapping_with_variable_in_dict_key(self):
+        variables = {"headers": {"$k": "v"}, "k": "X-Token"}
+        parsed_variables = parser.parse_variables_mapping(variables)
+        self.assertEqual(
+            parsed_variables, {"headers": {"X-Token": "v"}, "k": "X-Token"}
+        )
+        self.assertEqual(list(parsed_variables.keys()), ["headers", "k"])
+
+        with self.assertRaises(VariableNotFound):
+            parser.parse_variables_mapping({"headers": {"$headers": "v"}})
+        with self.assertRaises(VariableNotFound):
+            parser.parse_variables_mapping({"headers": {"$k": "v"}})
+
     def test_parse_string_value(self):
         self.assertEqual(parser.parse_string_value("123"), 123)
         self.assertEqual(parser.parse_string_value("12.3"), 12.3)
         self.assertEqual(parser.parse_string_value("a123"), "a123")
         self.assertEqual(parser.parse_string_value("$var"), "$var")
         self.assertEqual(parser.parse_string_value("${func}"), "${func}")
+        self.assertEqual(parser.parse_string_value("-1"), -1)
+        self.assertEqual(parser.parse_string_value(".5"), 0.5)
+        self.assertEqual(parser.parse_string_value("0123"), "0123")
+        self.assertEqual(parser.parse_string_value("True"), True)
+        self.assertEqual(parser.parse_string_value("None"), None)
+        self.assertEqual(parser.parse_string_value("'abc'"), "abc")
+        self.assertEqual(parser.parse_string_value("[1, 2]"), [1, 2])
+        self.assertEqual(parser.parse_string_value("9" * 5000), "9" * 5000)
 
     def test_regex_findall_variables(self):
         self.assertEqual(parser.regex_findall_variables("$variable"), ["variable"])
@@ -58,6 +115,18 @@ class TestParserBasic(unittest.TestCase):
             {"TOKEN", "data", "random"},
         )
         self.assertEqual(parser.extract_variables("Z:2>1*0*1+1$$1"), set())
+        self.assertEqual(
+            parser.extract_variables(
+                {"a": ["$x", ("${f($y)}", {"b": "$z"})], "c": 1, "d": {"$k": "v"}}
+            ),
+            {"x", "y", "z"},
+        )
+        self.assertEqual(parser.extract_variables(123), set())
+
+    def test_extract_variables_skip_plain_text(self):
+        parser._compile_string.cache_clear()
+        self.assertEqual(parser.extract_variables(["abc", {"a": "def"}]), set())
+        self.assertEqual(parser._compile_string.cache_info().currsize, 0)
 
     def test_parse_function_params(self):
         self.assertEqual(parser.parse_function_params(""), {"args": [], "kwargs": {}})
@@ -129,6 +198,9 @@ class TestParserBasic(unittest.TestCase):
         self.assertEqual(parser.parse_data("$var_1", variables_mapping), "abc")
         self.assertEqual(parser.parse_data("${var_1}", variables_mapping), "abc")
         self.assertEqual(parser.parse_data("var_1", variables_mapping), "var_1")
+        self.assertEqual(parser.parse_data(" \t$var_3 ", variables_mapping), 123)
+        self.assertEqual(parser.parse_data(" var_1\t", variables_mapping), "var_1")
+        self.assertEqual(parser.parse_data("var_1\n", variables_mapping), "var_1\n")
         self.assertEqual(parser.parse_data("$var_1#XYZ", variables_mapping), "abc#XYZ")
         self.assertEqual(
             parser.parse_data("${var_1}#XYZ", variables_mapping), "abc#XYZ"
@@ -336,6 +408,58 @@ class TestParserBasic(unittest.TestCase):
         )
         self.assertEqual(value, "ABCabc123abc--abc123abc")
 
+    def test_parse_data_reuse_compiled_string(self):
+        functions_mapping = {"add_one": lambda x: x + 1}
+        content = "/api/$uid/${add_one($num)}"
+        self.assertEqual(
+            parser.parse_data(content, {"uid": 1, "num": 1}, functions_mapping),
+            "/api/1/2",
+        )
+        self.assertEqual(
+            parser.parse_data(content, {"uid": 2, "num": 5}, functions_mapping),
+            "/api/2/6",
+        )
+        with self.assertRaises(VariableNotFound):
+            parser.parse_data(content, {"num": 5}, functions_mapping)
+
+    def test_parse_data_function_called_every_time(self):
+        counter = {"n": 0}
+
+        def incr(step):
+            counter["n"] += step
+            return counter["n"]
+
+        functions_mapping = {"incr": incr}
+        self.assertEqual(parser.parse_data("${incr(2)}", {}, functions_mapping), 2)
+        self.assertEqual(parser.parse_data("${incr(2)}", {}, functions_mapping), 4)
+        self.assertEqual(
+            parser.parse_data("n=${incr(1)}", {}, functions_mapping), "n=5"
+        )
+
+    def test_parse_data_functions_called_in_order(self):
+        counter = {"n": 0}
+
+        def incr():
+            counter["n"] += 1
+            return counter["n"]
+
+        functions_mapping = {"incr": incr}
+        content = {
+            "headers": {"a": "${incr()}"},
+            "json": {"b": "${incr()}", "c": ["${incr()}", {"d": "${incr()}"}]},
+            "x": "${incr()}",
+            "k${incr()}": "${incr()}",
+        }
+        self.assertEqual(
+            parser.parse_data(content, {}, functions_mapping),
+            {
+                "headers": {"a": 1},
+                "json": {"b": 2, "c": [3, {"d": 4}]},
+                "x": 5,
+                "k6": 7,
+            },
+        )
+
     def test_parse_data_func_abnormal(self):
         variables_mapping = {
             "var_1": "abc",
@@ -545,3 +669,20 @@ class TestParserBasic(unittest.TestCase):
             },
             parsed_params,
         )
+
+    def test_parse_parameters_iterated_twice(self):
+        from httprunner import Parameters
+
+        parsed_params = Parameters({"a": [1, 2], "b-c": [[3, 4], [5, 6]]})
+        expected_params = [
+            {"a": 1, "b": 3, "c": 4},
+            {"a": 1, "b": 5, "c": 6},
+            {"a": 2, "b": 3, "c": 4},
+            {"a": 2, "b": 5, "c": 6},
+        ]
+        self.assertEqual([param for param in parsed_params], expected_params)
+        # parameters are reused when a parametrized test class is subclassed
+        self.assertEqual([param for param in parsed_params], expected_params)
+
+        # project meta of current working directory is loaded, reset for other tests
+        loader.project_meta = None
@@ -1,7 +1,7 @@
 import os
 import unittest
 
-from httprunner import loader
+from httprunner import loader, Config, Step, RunRequest
 from httprunner.cli import main_run
 from httprunner.runner import HttpRunner
 
@@ -38,3 +38,29 @@ class TestHttpRunner(unittest.TestCase):
         self.assertTrue(os.path.exists("tests/data/debugtalk.py"))
         self.assertTrue(os.path.exists("tests/data/a_b_c/T1_test.py"))
         self.assertTrue(os.path.exists("tests/data/a_b_c/T2_3_test.py"))
+
+    def test_teststeps_isolated_between_runs(self):
+        class TestCaseDemo(HttpRunner):
+            config = Config("demo")
+            teststeps = [Step(RunRequest("get").with_variables(a="$b").get("/get"))]
+
+        step = TestCaseDemo().raw_testcase.teststeps[0]
+        step.variables = {"a": 1, "b": 1}
+        self.assertEqual(
+            TestCaseDemo().raw_testcase.teststeps[0].variables, {"a": "$b"}
+        )
+
+    def test_raw_testcase_built_once(self):
+        class TestCaseDemo(HttpRunner):
+            config = Config("demo")
+            teststeps = [Step(RunRequest("get").get("/get"))]
+            init_times = 0
+
+            def __init_tests__(self):
+                self.init_times += 1
+                super().__init_tests__()
+
+        runner = TestCaseDemo()
+        self.assertEqual(runner.raw_testcase.config.name, "demo")
+        self.assertEqual(len(runner.raw_testcase.teststeps), 1)
+        self.assertEqual(runner.init_times, 1)